@@ -1,8 +1,30 @@
 from .core.computer.terminal.base_language import BaseLanguage
-from .core.core import OpenInterpreter
 
-interpreter = OpenInterpreter()
-computer = interpreter.computer
+__all__ = ["BaseLanguage", "OpenInterpreter", "interpreter", "computer"]
+
+
+def __getattr__(name):
+    # `OpenInterpreter`, `interpreter` and `computer` are loaded on first access,
+    # so importing a submodule (like the CLI entry point) doesn't build an interpreter
+    if name == "OpenInterpreter":
+        from .core.core import OpenInterpreter
+
+        return OpenInterpreter
+
+    if name in ("interpreter", "computer"):
+        from .core.core import OpenInterpreter
+
+        global interpreter, computer
+        interpreter = OpenInterpreter()
+        computer = interpreter.computer
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 #     ____                      ____      __                            __
 #    / __ \____  ___  ____     /  _/___  / /____  _________  ________  / /____  _____
@@ -91,6 +91,10 @@ class OpenInterpreter:
         self.in_terminal_interface = in_terminal_interface
         self.multi_line = multi_line
 
+        # Arguments passed in via the CLI, keyed by argument name. Python profiles
+        # read these, since CLI values are only applied after the profile runs
+        self._cli_args = {}
+
         # Loop messages
         self.force_task_completion = force_task_completion
         self.force_task_completion_message = force_task_completion_message
@@ -1,7 +1,9 @@
 import ast
 import glob
+import hashlib
 import json
 import os
+import pickle
 import platform
 import shutil
 import string
@@ -14,11 +16,12 @@ import send2trash
 import yaml
 
 from ..utils.display_markdown_message import display_markdown_message
-from ..utils.oi_dir import oi_dir
+from ..utils.oi_dir import oi_cache_dir, oi_dir
 from .historical_profiles import historical_profiles
 
 profile_dir = os.path.join(oi_dir, "profiles")
 user_default_profile_path = os.path.join(profile_dir, "default.yaml")
+profile_cache_dir = os.path.join(oi_cache_dir, "profiles")
 
 here = os.path.abspath(os.path.dirname(__file__))
 oi_default_profiles_path = os.path.join(here, "defaults")
@@ -90,23 +93,21 @@ def get_profile(filename_or_url, profile_path):
 
     # Try local
     if os.path.exists(profile_path):
-        with open(profile_path, "r", encoding="utf-8") as file:
-            if extension == ".py":
+        if extension == ".py":
+            with open(profile_path, "r", encoding="utf-8") as file:
                 python_script = file.read()
 
-                # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
-                tree = ast.parse(python_script)
-                tree = RemoveInterpreter().visit(tree)
-                python_script = ast.unparse(tree)
-
-                return {
-                    "start_script": python_script,
-                    "version": OI_VERSION,
-                }  # Python scripts are always the latest version
-            elif extension == ".json":
-                return json.load(file)
-            else:
-                return yaml.safe_load(file)
+            # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
+            tree = ast.parse(python_script)
+            tree = RemoveInterpreter().visit(tree)
+            python_script = ast.unparse(tree)
+
+            return {
+                "start_script": python_script,
+                "version": OI_VERSION,
+            }  # Python scripts are always the latest version
+
+        return load_profile_file(profile_path)
 
     # Try URL
     response = requests.get(filename_or_url)
@@ -121,6 +122,42 @@ def get_profile(filename_or_url, profile_path):
     raise Exception(f"Profile '{filename_or_url}' not found.")
 
 
+def load_profile_file(profile_path):
+    """
+    Parses a local .yaml or .json profile. The parsed profile is pickled to the
+    cache directory and reused for as long as the file's mtime and size are unchanged.
+    """
+    stat = os.stat(profile_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = hashlib.sha256(os.path.abspath(profile_path).encode()).hexdigest()
+    cache_path = os.path.join(profile_cache_dir, f"{cache_key}.pkl")
+
+    try:
+        with open(cache_path, "rb") as file:
+            cached_signature, cached_profile = pickle.load(file)
+        if cached_signature == signature:
+            return cached_profile
+    except Exception:
+        # Missing or unreadable cache, just parse the file
+        pass
+
+    extension = os.path.splitext(profile_path)[-1]
+    with open(profile_path, "r", encoding="utf-8") as file:
+        if extension == ".json":
+            profile = json.load(file)
+        else:
+            profile = yaml.safe_load(file)
+
+    try:
+        os.makedirs(profile_cache_dir, exist_ok=True)
+        with open(cache_path, "wb") as file:
+            pickle.dump((signature, profile), file)
+    except OSError:
+        pass
+
+    return profile
+
+
 class RemoveInterpreter(ast.NodeTransformer):
     """Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`"""
 
@@ -636,23 +673,21 @@ def get_default_profile(specific_default_profile):
         profile_path = os.path.join(oi_default_profiles_path, filename)
         extension = os.path.splitext(filename)[-1]
 
-        with open(profile_path, "r", encoding="utf-8") as file:
-            if extension == ".py":
+        if extension == ".py":
+            with open(profile_path, "r", encoding="utf-8") as file:
                 python_script = file.read()
 
-                # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
-                tree = ast.parse(python_script)
-                tree = RemoveInterpreter().visit(tree)
-                python_script = ast.unparse(tree)
-
-                return {
-                    "start_script": python_script,
-                    "version": OI_VERSION,
-                }  # Python scripts are always the latest version
-            elif extension == ".json":
-                return json.load(file)
-            else:
-                return yaml.safe_load(file)
+            # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
+            tree = ast.parse(python_script)
+            tree = RemoveInterpreter().visit(tree)
+            python_script = ast.unparse(tree)
+
+            return {
+                "start_script": python_script,
+                "version": OI_VERSION,
+            }  # Python scripts are always the latest version
+
+        return load_profile_file(profile_path)
 
 
 def determine_user_version():
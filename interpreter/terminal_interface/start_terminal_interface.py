@@ -1,15 +1,269 @@
 import argparse
 import sys
-import time
+import threading
+
+# Heavier modules (the interpreter core, profiles, update checks) are imported
+# inside the branches that use them, so trivial invocations like `--version` stay fast
+
+
+# Every CLI argument. Attributes are referenced by the name of the object that
+# holds them ("interpreter" or "llm") and resolved against an instance at call time
+_ARGUMENT_SPECS = (
+    {
+        "name": "profile",
+        "nickname": "p",
+        "help_text": "name of profile. run `--profiles` to open profile directory",
+        "type": str,
+        "default": "default.yaml",
+    },
+    {
+        "name": "custom_instructions",
+        "nickname": "ci",
+        "help_text": "custom instructions for the language model. will be appended to the system_message",
+        "type": str,
+        "attribute": {"object": "interpreter", "attr_name": "custom_instructions"},
+    },
+    {
+        "name": "system_message",
+        "nickname": "s",
+        "help_text": "(we don't recommend changing this) base prompt for the language model",
+        "type": str,
+        "attribute": {"object": "interpreter", "attr_name": "system_message"},
+    },
+    {
+        "name": "auto_run",
+        "nickname": "y",
+        "help_text": "automatically run generated code",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "auto_run"},
+    },
+    {
+        "name": "verbose",
+        "nickname": "v",
+        "help_text": "print detailed logs",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "verbose"},
+    },
+    {
+        "name": "model",
+        "nickname": "m",
+        "help_text": "language model to use",
+        "type": str,
+        "attribute": {"object": "llm", "attr_name": "model"},
+    },
+    {
+        "name": "temperature",
+        "nickname": "t",
+        "help_text": "optional temperature setting for the language model",
+        "type": float,
+        "attribute": {"object": "llm", "attr_name": "temperature"},
+    },
+    {
+        "name": "llm_supports_vision",
+        "nickname": "lsv",
+        "help_text": "inform OI that your model supports vision, and can recieve vision inputs",
+        "type": bool,
+        "action": argparse.BooleanOptionalAction,
+        "attribute": {"object": "llm", "attr_name": "supports_vision"},
+    },
+    {
+        "name": "llm_supports_functions",
+        "nickname": "lsf",
+        "help_text": "inform OI that your model supports OpenAI-style functions, and can make function calls",
+        "type": bool,
+        "action": argparse.BooleanOptionalAction,
+        "attribute": {"object": "llm", "attr_name": "supports_functions"},
+    },
+    {
+        "name": "context_window",
+        "nickname": "cw",
+        "help_text": "optional context window size for the language model",
+        "type": int,
+        "attribute": {"object": "llm", "attr_name": "context_window"},
+    },
+    {
+        "name": "max_tokens",
+        "nickname": "x",
+        "help_text": "optional maximum number of tokens for the language model",
+        "type": int,
+        "attribute": {"object": "llm", "attr_name": "max_tokens"},
+    },
+    {
+        "name": "max_budget",
+        "nickname": "b",
+        "help_text": "optionally set the max budget (in USD) for your llm calls",
+        "type": float,
+        "attribute": {"object": "llm", "attr_name": "max_budget"},
+    },
+    {
+        "name": "api_base",
+        "nickname": "ab",
+        "help_text": "optionally set the API base URL for your llm calls (this will override environment variables)",
+        "type": str,
+        "attribute": {"object": "llm", "attr_name": "api_base"},
+    },
+    {
+        "name": "api_key",
+        "nickname": "ak",
+        "help_text": "optionally set the API key for your llm calls (this will override environment variables)",
+        "type": str,
+        "attribute": {"object": "llm", "attr_name": "api_key"},
+    },
+    {
+        "name": "api_version",
+        "nickname": "av",
+        "help_text": "optionally set the API version for your llm calls (this will override environment variables)",
+        "type": str,
+        "attribute": {"object": "llm", "attr_name": "api_version"},
+    },
+    {
+        "name": "max_output",
+        "nickname": "xo",
+        "help_text": "optional maximum number of characters for code outputs",
+        "type": int,
+        "attribute": {"object": "interpreter", "attr_name": "max_output"},
+    },
+    {
+        "name": "force_task_completion",
+        "nickname": "fc",
+        "help_text": "runs OI in a loop, requiring it to admit to completing/failing task",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "force_task_completion"},
+    },
+    {
+        "name": "disable_telemetry",
+        "nickname": "dt",
+        "help_text": "disables sending of basic anonymous usage stats",
+        "type": bool,
+        "default": True,
+        "action": "store_false",
+        "attribute": {"object": "interpreter", "attr_name": "anonymous_telemetry"},
+    },
+    {
+        "name": "offline",
+        "nickname": "o",
+        "help_text": "turns off all online features (except the language model, if it's hosted)",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "offline"},
+    },
+    {
+        "name": "speak_messages",
+        "nickname": "sm",
+        "help_text": "(Mac only, experimental) use the applescript `say` command to read messages aloud",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "speak_messages"},
+    },
+    {
+        "name": "safe_mode",
+        "nickname": "safe",
+        "help_text": "optionally enable safety mechanisms like code scanning; valid options are off, ask, and auto",
+        "type": str,
+        "choices": ["off", "ask", "auto"],
+        "default": "off",
+        "attribute": {"object": "interpreter", "attr_name": "safe_mode"},
+    },
+    {
+        "name": "debug",
+        "nickname": "debug",
+        "help_text": "debug mode for open interpreter developers",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "debug"},
+    },
+    {
+        "name": "fast",
+        "nickname": "f",
+        "help_text": "runs `interpreter --model gpt-3.5-turbo` and asks OI to be extremely concise",
+        "type": bool,
+    },
+    {
+        "name": "multi_line",
+        "nickname": "ml",
+        "help_text": "enable multi-line inputs starting and ending with ```",
+        "type": bool,
+        "attribute": {"object": "interpreter", "attr_name": "multi_line"},
+    },
+    {
+        "name": "local",
+        "nickname": "l",
+        "help_text": "experimentally run the LLM locally via Llamafile (this changes many more settings than `--offline`)",
+        "type": bool,
+    },
+    {
+        "name": "vision",
+        "nickname": "vi",
+        "help_text": "experimentally use vision for supported languages",
+        "type": bool,
+    },
+    {
+        "name": "os",
+        "nickname": "os",
+        "help_text": "experimentally let Open Interpreter control your mouse and keyboard",
+        "type": bool,
+    },
+    # Special commands
+    {
+        "name": "reset_profile",
+        "help_text": "reset a profile file. run `--reset_profile` without an argument to reset all default profiles",
+        "type": str,
+        "default": "NOT_PROVIDED",
+        "nargs": "?",  # This means you can pass in nothing if you want
+    },
+    {"name": "profiles", "help_text": "opens profiles directory", "type": bool},
+    {
+        "name": "conversations",
+        "help_text": "list conversations to resume",
+        "type": bool,
+    },
+    {
+        "name": "server",
+        "help_text": "start open interpreter as a server",
+        "type": bool,
+    },
+    {
+        "name": "version",
+        "help_text": "get Open Interpreter's version number",
+        "type": bool,
+    },
+)
+
+_ARG_BY_NAME = {a["name"]: a for a in _ARGUMENT_SPECS}
+
+# Arguments that must already be applied while a profile script runs
+_PROFILE_RUNTIME_ARGUMENTS = ("verbose", "debug", "offline")
+
+# Flags that are shorthand for a default profile, in order of precedence
+_PROFILE_SHORTCUTS = (
+    ("local", "local.py"),
+    ("os", "os.py"),
+    ("vision", "vision.yaml"),
+    ("fast", "fast.yaml"),
+)
+
+
+def _make_applier(target, attr_name):
+    """
+    Returns a function that sets `attr_name` on the interpreter (or on its llm,
+    if `target` is "llm").
+    """
+    if target == "llm":
+
+        def apply(interpreter, value):
+            setattr(interpreter.llm, attr_name, value)
+
+    else:
 
-import pkg_resources
+        def apply(interpreter, value):
+            setattr(interpreter, attr_name, value)
 
-from ..core.core import OpenInterpreter
-from .conversation_navigator import conversation_navigator
-from .profiles.profiles import open_profile_dir, profile, reset_profile
-from .utils.check_for_update import check_for_update
-from .utils.display_markdown_message import display_markdown_message
-from .validate_llm_settings import validate_llm_settings
+    return apply
+
+
+# Setters for every argument that maps onto an attribute, resolved once at import
+_APPLIERS = {
+    a["name"]: _make_applier(a["attribute"]["object"], a["attribute"]["attr_name"])
+    for a in _ARGUMENT_SPECS
+    if "attribute" in a
+}
 
 
 def start_terminal_interface(interpreter):
@@ -17,224 +271,6 @@ def start_terminal_interface(interpreter):
     Meant to be used from the command line. Parses arguments, starts OI's terminal interface.
     """
 
-    arguments = [
-        {
-            "name": "profile",
-            "nickname": "p",
-            "help_text": "name of profile. run `--profiles` to open profile directory",
-            "type": str,
-            "default": "default.yaml",
-        },
-        {
-            "name": "custom_instructions",
-            "nickname": "ci",
-            "help_text": "custom instructions for the language model. will be appended to the system_message",
-            "type": str,
-            "attribute": {"object": interpreter, "attr_name": "custom_instructions"},
-        },
-        {
-            "name": "system_message",
-            "nickname": "s",
-            "help_text": "(we don't recommend changing this) base prompt for the language model",
-            "type": str,
-            "attribute": {"object": interpreter, "attr_name": "system_message"},
-        },
-        {
-            "name": "auto_run",
-            "nickname": "y",
-            "help_text": "automatically run generated code",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "auto_run"},
-        },
-        {
-            "name": "verbose",
-            "nickname": "v",
-            "help_text": "print detailed logs",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "verbose"},
-        },
-        {
-            "name": "model",
-            "nickname": "m",
-            "help_text": "language model to use",
-            "type": str,
-            "attribute": {"object": interpreter.llm, "attr_name": "model"},
-        },
-        {
-            "name": "temperature",
-            "nickname": "t",
-            "help_text": "optional temperature setting for the language model",
-            "type": float,
-            "attribute": {"object": interpreter.llm, "attr_name": "temperature"},
-        },
-        {
-            "name": "llm_supports_vision",
-            "nickname": "lsv",
-            "help_text": "inform OI that your model supports vision, and can recieve vision inputs",
-            "type": bool,
-            "action": argparse.BooleanOptionalAction,
-            "attribute": {"object": interpreter.llm, "attr_name": "supports_vision"},
-        },
-        {
-            "name": "llm_supports_functions",
-            "nickname": "lsf",
-            "help_text": "inform OI that your model supports OpenAI-style functions, and can make function calls",
-            "type": bool,
-            "action": argparse.BooleanOptionalAction,
-            "attribute": {"object": interpreter.llm, "attr_name": "supports_functions"},
-        },
-        {
-            "name": "context_window",
-            "nickname": "cw",
-            "help_text": "optional context window size for the language model",
-            "type": int,
-            "attribute": {"object": interpreter.llm, "attr_name": "context_window"},
-        },
-        {
-            "name": "max_tokens",
-            "nickname": "x",
-            "help_text": "optional maximum number of tokens for the language model",
-            "type": int,
-            "attribute": {"object": interpreter.llm, "attr_name": "max_tokens"},
-        },
-        {
-            "name": "max_budget",
-            "nickname": "b",
-            "help_text": "optionally set the max budget (in USD) for your llm calls",
-            "type": float,
-            "attribute": {"object": interpreter.llm, "attr_name": "max_budget"},
-        },
-        {
-            "name": "api_base",
-            "nickname": "ab",
-            "help_text": "optionally set the API base URL for your llm calls (this will override environment variables)",
-            "type": str,
-            "attribute": {"object": interpreter.llm, "attr_name": "api_base"},
-        },
-        {
-            "name": "api_key",
-            "nickname": "ak",
-            "help_text": "optionally set the API key for your llm calls (this will override environment variables)",
-            "type": str,
-            "attribute": {"object": interpreter.llm, "attr_name": "api_key"},
-        },
-        {
-            "name": "api_version",
-            "nickname": "av",
-            "help_text": "optionally set the API version for your llm calls (this will override environment variables)",
-            "type": str,
-            "attribute": {"object": interpreter.llm, "attr_name": "api_version"},
-        },
-        {
-            "name": "max_output",
-            "nickname": "xo",
-            "help_text": "optional maximum number of characters for code outputs",
-            "type": int,
-            "attribute": {"object": interpreter, "attr_name": "max_output"},
-        },
-        {
-            "name": "force_task_completion",
-            "nickname": "fc",
-            "help_text": "runs OI in a loop, requiring it to admit to completing/failing task",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "force_task_completion"},
-        },
-        {
-            "name": "disable_telemetry",
-            "nickname": "dt",
-            "help_text": "disables sending of basic anonymous usage stats",
-            "type": bool,
-            "default": True,
-            "action": "store_false",
-            "attribute": {"object": interpreter, "attr_name": "anonymous_telemetry"},
-        },
-        {
-            "name": "offline",
-            "nickname": "o",
-            "help_text": "turns off all online features (except the language model, if it's hosted)",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "offline"},
-        },
-        {
-            "name": "speak_messages",
-            "nickname": "sm",
-            "help_text": "(Mac only, experimental) use the applescript `say` command to read messages aloud",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "speak_messages"},
-        },
-        {
-            "name": "safe_mode",
-            "nickname": "safe",
-            "help_text": "optionally enable safety mechanisms like code scanning; valid options are off, ask, and auto",
-            "type": str,
-            "choices": ["off", "ask", "auto"],
-            "default": "off",
-            "attribute": {"object": interpreter, "attr_name": "safe_mode"},
-        },
-        {
-            "name": "debug",
-            "nickname": "debug",
-            "help_text": "debug mode for open interpreter developers",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "debug"},
-        },
-        {
-            "name": "fast",
-            "nickname": "f",
-            "help_text": "runs `interpreter --model gpt-3.5-turbo` and asks OI to be extremely concise",
-            "type": bool,
-        },
-        {
-            "name": "multi_line",
-            "nickname": "ml",
-            "help_text": "enable multi-line inputs starting and ending with ```",
-            "type": bool,
-            "attribute": {"object": interpreter, "attr_name": "multi_line"},
-        },
-        {
-            "name": "local",
-            "nickname": "l",
-            "help_text": "experimentally run the LLM locally via Llamafile (this changes many more settings than `--offline`)",
-            "type": bool,
-        },
-        {
-            "name": "vision",
-            "nickname": "vi",
-            "help_text": "experimentally use vision for supported languages",
-            "type": bool,
-        },
-        {
-            "name": "os",
-            "nickname": "os",
-            "help_text": "experimentally let Open Interpreter control your mouse and keyboard",
-            "type": bool,
-        },
-        # Special commands
-        {
-            "name": "reset_profile",
-            "help_text": "reset a profile file. run `--reset_profile` without an argument to reset all default profiles",
-            "type": str,
-            "default": "NOT_PROVIDED",
-            "nargs": "?",  # This means you can pass in nothing if you want
-        },
-        {"name": "profiles", "help_text": "opens profiles directory", "type": bool},
-        {
-            "name": "conversations",
-            "help_text": "list conversations to resume",
-            "type": bool,
-        },
-        {
-            "name": "server",
-            "help_text": "start open interpreter as a server",
-            "type": bool,
-        },
-        {
-            "name": "version",
-            "help_text": "get Open Interpreter's version number",
-            "type": bool,
-        },
-    ]
-
     # Check for deprecated flags before parsing arguments
     deprecated_flags = {
         "--debug_mode": "--verbose",
@@ -242,78 +278,57 @@ def start_terminal_interface(interpreter):
 
     for old_flag, new_flag in deprecated_flags.items():
         if old_flag in sys.argv:
-            print(f"\n`{old_flag}` has been renamed to `{new_flag}`.\n")
-            time.sleep(1.5)
+            # Yellow, on stderr, so it's noticeable without pausing startup
+            print(
+                f"\n\033[33m`{old_flag}` has been renamed to `{new_flag}`.\033[0m\n",
+                file=sys.stderr,
+            )
             sys.argv.remove(old_flag)
             sys.argv.append(new_flag)
 
     parser = argparse.ArgumentParser(description="Open Interpreter")
 
     # Add arguments
-    for arg in arguments:
-        action = arg.get("action", "store_true")
+    for arg in _ARGUMENT_SPECS:
         nickname = arg.get("nickname")
-        default = arg.get("default")
+        flags = [f'--{arg["name"]}']
+        if nickname:
+            flags.insert(0, f"-{nickname}")
+        kwargs = {
+            "dest": arg["name"],
+            "help": arg["help_text"],
+            "default": arg.get("default"),
+        }
 
         if arg["type"] == bool:
-            if nickname:
-                parser.add_argument(
-                    f"-{nickname}",
-                    f'--{arg["name"]}',
-                    dest=arg["name"],
-                    help=arg["help_text"],
-                    action=action,
-                    default=default,
-                )
-            else:
-                parser.add_argument(
-                    f'--{arg["name"]}',
-                    dest=arg["name"],
-                    help=arg["help_text"],
-                    action=action,
-                    default=default,
-                )
+            kwargs["action"] = arg.get("action", "store_true")
         else:
-            choices = arg.get("choices")
-
-            if nickname:
-                parser.add_argument(
-                    f"-{nickname}",
-                    f'--{arg["name"]}',
-                    dest=arg["name"],
-                    help=arg["help_text"],
-                    type=arg["type"],
-                    choices=choices,
-                    default=default,
-                    nargs=arg.get("nargs"),
-                )
-            else:
-                parser.add_argument(
-                    f'--{arg["name"]}',
-                    dest=arg["name"],
-                    help=arg["help_text"],
-                    type=arg["type"],
-                    choices=choices,
-                    default=default,
-                    nargs=arg.get("nargs"),
-                )
+            kwargs["type"] = arg["type"]
+            # Only pass these when set
+            for key in ("choices", "nargs"):
+                if arg.get(key) is not None:
+                    kwargs[key] = arg[key]
+
+        parser.add_argument(*flags, **kwargs)
 
     args = parser.parse_args()
 
     if args.profiles:
+        from .profiles.profiles import open_profile_dir
+
         open_profile_dir()
         return
 
     if args.reset_profile != "NOT_PROVIDED":
+        from .profiles.profiles import reset_profile
+
         reset_profile(
             args.reset_profile
         )  # This will be None if they just ran `--reset_profile`
         return
 
     if args.version:
-        version = pkg_resources.get_distribution("open-interpreter").version
-        update_name = "New Computer Update"  # Change this with each major update
-        print(f"Open Interpreter {version} {update_name}")
+        print_version()
         return
 
     # if safe_mode and auto_run are enabled, safe_mode disables auto_run
@@ -322,29 +337,31 @@ def start_terminal_interface(interpreter):
     ):
         setattr(interpreter, "auto_run", False)
 
-    if args.fast:
-        args.profile = "fast.yaml"
-
-    if args.vision:
-        args.profile = "vision.yaml"
-
-    if args.os:
-        args.profile = "os.py"
+    for flag, profile_name in _PROFILE_SHORTCUTS:
+        if getattr(args, flag):
+            args.profile = profile_name
+            break
 
-    if args.local:
-        args.profile = "local.py"
+    ### Stash the arguments passed in via the CLI, so that a profile script can read them
 
-    ### Set attributes on interpreter, so that a profile script can read the arguments passed in via the CLI
+    interpreter._cli_args = {k: v for k, v in vars(args).items() if v is not None}
 
-    set_attributes(args, arguments)
+    # Profile scripts run code (e.g. skill imports) that reads these indirectly,
+    # so they need to be in place before the profile, not just after it
+    for argument_name in _PROFILE_RUNTIME_ARGUMENTS:
+        argument_value = getattr(args, argument_name)
+        if argument_value is not None:
+            _APPLIERS[argument_name](interpreter, argument_value)
 
     ### Apply profile
 
+    from .profiles.profiles import profile
+
     interpreter = profile(interpreter, args.profile)
 
     ### Set attributes on interpreter, because the arguments passed in via the CLI should override profile
 
-    set_attributes(args, arguments)
+    set_attributes(args, interpreter, verbose=args.verbose)
 
     ### Set some helpful settings we know are likely to be true
 
@@ -364,52 +381,155 @@ def start_terminal_interface(interpreter):
         if interpreter.llm.supports_functions is None:
             interpreter.llm.supports_functions = True
 
-    ### Check for update
+    ### Check for update in the background, so the network request doesn't block startup
 
-    try:
-        if not interpreter.offline:
-            # This message should actually be pushed into the utility
-            if check_for_update():
-                display_markdown_message(
-                    "> **A new version of Open Interpreter is available.**\n>Please run: `pip install --upgrade open-interpreter`\n\n---"
-                )
-    except:
-        # Doesn't matter
-        pass
+    update_check = start_update_check(interpreter)
 
     # If --conversations is used, run conversation_navigator
     if args.conversations:
+        from .conversation_navigator import conversation_navigator
+
+        display_update_message(update_check)
         conversation_navigator(interpreter)
         return
 
     if args.server:
+        display_update_message(update_check)
         interpreter.server()
         return
 
+    from .validate_llm_settings import validate_llm_settings
+
     validate_llm_settings(interpreter)
 
     interpreter.in_terminal_interface = True
 
+    display_update_message(update_check)
+
     interpreter.chat()
 
 
-def set_attributes(args, arguments):
+def start_update_check(interpreter):
+    """
+    Starts checking PyPI for a newer version on a daemon thread.
+    Returns a (thread, result) pair for `display_update_message`, or None if there's nothing to check.
+    """
+    if interpreter.offline:
+        return None
+
+    # The cache is only consulted here. A fresh answer means we don't even
+    # need to import the update checker
+    try:
+        from importlib.metadata import version as package_version
+
+        from .utils.update_check_cache import read_update_check_cache
+
+        current_version = package_version("open-interpreter")
+        cached = read_update_check_cache(current_version)
+    except:
+        # Doesn't matter
+        return None
+    if cached is False:
+        return None
+    if cached:
+        return None, {"update_available": True}
+
+    result = {}
+
+    def check():
+        try:
+            from .utils.check_for_update import check_for_update
+
+            result["update_available"] = check_for_update(current_version)
+        except:
+            # Doesn't matter
+            pass
+
+    thread = threading.Thread(target=check, daemon=True)
+    thread.start()
+    return thread, result
+
+
+def display_update_message(update_check, timeout=0.25):
+    # Only wait briefly. If PyPI is slow, we just skip the message this time
+    if update_check is None:
+        return
+    thread, result = update_check
+    if thread is not None:
+        thread.join(timeout=timeout)
+    if result.get("update_available"):
+        from .utils.display_markdown_message import display_markdown_message
+
+        # This message should actually be pushed into the utility
+        display_markdown_message(
+            "> **A new version of Open Interpreter is available.**\n>Please run: `pip install --upgrade open-interpreter`\n\n---"
+        )
+
+
+def _fast_path(argv):
+    """
+    Handles `interpreter --version`, `interpreter --profiles` and
+    `interpreter --reset_profile [name]` straight from argv.
+    Only exact invocations are handled. Anything else (other flags, abbreviations,
+    typos) goes through the full parser, so argparse's behaviour is unchanged.
+    Returns True if a command was handled, in which case nothing else should run.
+    """
+    if argv == ["--version"]:
+        print_version()
+        return True
+
+    if argv == ["--profiles"]:
+        from .profiles.profiles import open_profile_dir
+
+        open_profile_dir()
+        return True
+
+    # `--reset_profile` optionally takes the name of the profile to reset
+    if argv[:1] == ["--reset_profile"] and (
+        len(argv) == 1 or (len(argv) == 2 and not argv[1].startswith("-"))
+    ):
+        from .profiles.profiles import reset_profile
+
+        reset_profile(argv[1] if len(argv) == 2 else None)
+        return True
+
+    return False
+
+
+def print_version():
+    from importlib.metadata import version as package_version
+
+    version = package_version("open-interpreter")
+    update_name = "New Computer Update"  # Change this with each major update
+    print(f"Open Interpreter {version} {update_name}")
+
+
+def set_attributes(args, interpreter, verbose=False):
+    if not verbose:
+        for argument_name, argument_value in vars(args).items():
+            if argument_value is not None and argument_name in _APPLIERS:
+                _APPLIERS[argument_name](interpreter, argument_value)
+        return
+
     for argument_name, argument_value in vars(args).items():
-        if argument_value is not None:
-            argument_dictionary = [a for a in arguments if a["name"] == argument_name]
-            if len(argument_dictionary) > 0:
-                argument_dictionary = argument_dictionary[0]
-                if "attribute" in argument_dictionary:
-                    attr_dict = argument_dictionary["attribute"]
-                    setattr(attr_dict["object"], attr_dict["attr_name"], argument_value)
+        if argument_value is None or argument_name not in _APPLIERS:
+            continue
+
+        _APPLIERS[argument_name](interpreter, argument_value)
 
-                    if args.verbose:
-                        print(
-                            f"Setting attribute {attr_dict['attr_name']} on {attr_dict['object'].__class__.__name__.lower()} to '{argument_value}'..."
-                        )
+        attr_dict = _ARG_BY_NAME[argument_name]["attribute"]
+        print(
+            f"Setting attribute {attr_dict['attr_name']} on {attr_dict['object']} to '{argument_value}'..."
+        )
 
 
 def main():
+    # Handle trivial commands before constructing OpenInterpreter or the argument parser
+    if _fast_path(sys.argv[1:]):
+        return
+
+    from ..core.core import OpenInterpreter
+
     interpreter = OpenInterpreter()
     try:
         start_terminal_interface(interpreter)
@@ -1,14 +1,24 @@
-import pkg_resources
+from importlib.metadata import version as package_version
+
 import requests
 from packaging import version
 
+from .update_check_cache import write_update_check_cache
+
+
+def check_for_update(current_version=None):
+    """
+    Asks PyPI whether a newer version is available, and caches the answer.
+    Callers are expected to consult `read_update_check_cache` first.
+    """
+    if current_version is None:
+        # Get the current version from the installed package metadata
+        current_version = package_version("open-interpreter")
 
-def check_for_update():
     # Fetch the latest version from the PyPI API
     response = requests.get(f"https://pypi.org/pypi/open-interpreter/json")
     latest_version = response.json()["info"]["version"]
 
-    # Get the current version using pkg_resources
-    current_version = pkg_resources.get_distribution("open-interpreter").version
-
-    return version.parse(latest_version) > version.parse(current_version)
+    update_available = version.parse(latest_version) > version.parse(current_version)
+    write_update_check_cache(current_version, update_available)
+    return update_available
@@ -1,3 +1,4 @@
 import platformdirs
 
 oi_dir = platformdirs.user_config_dir("open-interpreter")
+oi_cache_dir = platformdirs.user_cache_dir("open-interpreter")
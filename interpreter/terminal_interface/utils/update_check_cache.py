@@ -0,0 +1,46 @@
+import json
+import os
+import time
+
+from .oi_dir import oi_cache_dir
+
+update_check_cache_path = os.path.join(oi_cache_dir, "update_check.json")
+
+# How long a PyPI lookup stays valid
+UPDATE_CHECK_TTL = 24 * 60 * 60
+
+
+def read_update_check_cache(current_version):
+    """
+    Returns the cached "is an update available" answer for `current_version`,
+    or None if there is no fresh entry (missing, expired, or from another version).
+    """
+    try:
+        with open(update_check_cache_path, "r") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if cache.get("version") != current_version:
+        # They upgraded (or downgraded) since the last check
+        return None
+    if time.time() - cache.get("checked_at", 0) > UPDATE_CHECK_TTL:
+        return None
+    return cache.get("update_available")
+
+
+def write_update_check_cache(current_version, update_available):
+    try:
+        os.makedirs(oi_cache_dir, exist_ok=True)
+        with open(update_check_cache_path, "w") as file:
+            json.dump(
+                {
+                    "version": current_version,
+                    "update_available": update_available,
+                    "checked_at": time.time(),
+                },
+                file,
+            )
+    except OSError:
+        # Caching is best-effort
+        pass
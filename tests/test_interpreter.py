@@ -1,5 +1,6 @@
 import os
 import platform
+import sys
 import time
 from random import randint
 
@@ -594,3 +595,160 @@ def test_token_counter():
     prompt_tokens_ok = system_tokens + prompt_tokens == prompt_token_test[0]
 
     assert system_tokens_ok and prompt_tokens_ok
+
+
+def test_update_check_cache(tmp_path, monkeypatch):
+    from interpreter.terminal_interface.utils import update_check_cache
+
+    monkeypatch.setattr(update_check_cache, "oi_cache_dir", str(tmp_path))
+    monkeypatch.setattr(
+        update_check_cache,
+        "update_check_cache_path",
+        str(tmp_path / "update_check.json"),
+    )
+
+    assert update_check_cache.read_update_check_cache("0.2.2") is None
+
+    update_check_cache.write_update_check_cache("0.2.2", False)
+    assert update_check_cache.read_update_check_cache("0.2.2") is False
+
+    # A different installed version invalidates the cache
+    assert update_check_cache.read_update_check_cache("0.2.3") is None
+
+    # So does age
+    monkeypatch.setattr(update_check_cache, "UPDATE_CHECK_TTL", -1)
+    assert update_check_cache.read_update_check_cache("0.2.2") is None
+
+
+def test_profile_cache(tmp_path, monkeypatch):
+    from interpreter.terminal_interface.profiles import profiles
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(profiles, "profile_cache_dir", str(cache_dir))
+
+    profile_path = tmp_path / "test.yaml"
+    profile_path.write_text("llm:\n  model: gpt-4\n")
+
+    # The first load parses the file and writes the pickle
+    assert profiles.load_profile_file(str(profile_path)) == {"llm": {"model": "gpt-4"}}
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    # The second load is served from the pickle, without parsing
+    def fail_safe_load(file):
+        raise AssertionError("profile was parsed instead of loaded from cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(profiles.yaml, "safe_load", fail_safe_load)
+        assert profiles.load_profile_file(str(profile_path)) == {
+            "llm": {"model": "gpt-4"}
+        }
+
+    # Rewriting the file (new mtime and size) invalidates the cache
+    stat = os.stat(profile_path)
+    profile_path.write_text("llm:\n  model: gpt-3.5-turbo\n")
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert profiles.load_profile_file(str(profile_path)) == {
+        "llm": {"model": "gpt-3.5-turbo"}
+    }
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+def test_fast_path(monkeypatch):
+    from interpreter.terminal_interface import start_terminal_interface as sti
+    from interpreter.terminal_interface.profiles import profiles
+
+    calls = []
+    monkeypatch.setattr(sti, "print_version", lambda: calls.append("version"))
+    monkeypatch.setattr(profiles, "open_profile_dir", lambda: calls.append("profiles"))
+    monkeypatch.setattr(profiles, "reset_profile", lambda name: calls.append(name))
+
+    assert sti._fast_path(["--version"])
+    assert sti._fast_path(["--reset_profile", "x"])
+
+    # Anything but the exact forms is left to argparse
+    assert not sti._fast_path(["--profiles", "--version"])
+    assert not sti._fast_path(["--version", "--bogus"])
+    assert not sti._fast_path(["--reset_profile", "-v"])
+
+    assert calls == ["version", "x"]
+
+
+def _run_terminal_interface(monkeypatch, argv, fake_profile):
+    """Runs start_terminal_interface against a stub interpreter, with `fake_profile` in place of profile()"""
+    from types import SimpleNamespace
+
+    from interpreter.terminal_interface import start_terminal_interface as sti
+    from interpreter.terminal_interface.profiles import profiles
+
+    stub = SimpleNamespace(
+        auto_run=False,
+        safe_mode="off",
+        offline=False,
+        verbose=False,
+        debug=False,
+        custom_instructions="",
+        _cli_args={},
+        llm=SimpleNamespace(
+            model=None,
+            temperature=None,
+            context_window=None,
+            max_tokens=None,
+            supports_functions=None,
+            supports_vision=None,
+        ),
+        server=lambda: None,
+    )
+
+    monkeypatch.setattr(profiles, "profile", fake_profile)
+    # --server and --offline keep this away from the LLM and the network
+    monkeypatch.setattr(sys, "argv", ["interpreter", *argv, "--server", "--offline"])
+    sti.start_terminal_interface(stub)
+    return stub
+
+
+def test_cli_arguments_during_and_after_profile(monkeypatch):
+    seen = {}
+
+    def fake_profile(interpreter, filename):
+        seen["cli_args"] = dict(interpreter._cli_args)
+        seen["offline"] = interpreter.offline
+        seen["verbose"] = interpreter.verbose
+        seen["model"] = interpreter.llm.model
+        seen["auto_run"] = interpreter.auto_run
+
+        interpreter.llm.model = "profile-model"
+        interpreter.custom_instructions = "from the profile"
+        return interpreter
+
+    stub = _run_terminal_interface(
+        monkeypatch, ["-m", "cli-model", "-y", "-v"], fake_profile
+    )
+
+    # While the profile runs, every CLI value is readable from _cli_args...
+    assert seen["cli_args"]["model"] == "cli-model"
+    assert seen["cli_args"]["auto_run"] is True
+    # ...but only verbose, debug and offline are already applied
+    assert seen["offline"] is True
+    assert seen["verbose"] is True
+    assert seen["model"] is None
+    assert seen["auto_run"] is False
+
+    # Afterwards, CLI values win over the profile's
+    assert stub.llm.model == "cli-model"
+    assert stub.auto_run is True
+    assert stub.custom_instructions == "from the profile"
+
+
+def test_profile_shortcut_precedence(monkeypatch):
+    loaded = []
+
+    def fake_profile(interpreter, filename):
+        loaded.append(filename)
+        return interpreter
+
+    _run_terminal_interface(
+        monkeypatch, ["--fast", "--vision", "--os", "--local"], fake_profile
+    )
+    _run_terminal_interface(monkeypatch, ["--fast", "--vision"], fake_profile)
+
+    assert loaded == ["local.py", "vision.yaml"]